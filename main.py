@@ -1,14 +1,18 @@
+import os
+import atexit
 import sys
 import re
 import secrets
 import string
 import random
+import shutil
 import calendar
 import webbrowser
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime, date
+from typing import TextIO
+from datetime import datetime
 
 # =============================
 # Configuration
@@ -26,26 +30,26 @@ SAFE_PUNCT = "!@#$%^&*()-_=+[]{}:;,./?"
 PASSWORD_ALPHABET = string.ascii_letters + string.digits + SAFE_PUNCT
 
 # Common English names
-FIRST_NAMES = [
+FIRST_NAMES = (
     "Oliver", "George", "Harry", "Jack", "Noah",
     "Olivia", "Amelia", "Isla", "Ava", "Mia",
     "Liam", "Emma", "Sophia", "Charlotte", "James",
     "Benjamin", "Lucas", "Henry", "Ethan", "Grace"
-]
-LAST_NAMES = [
+)
+LAST_NAMES = (
     "Smith", "Johnson", "Williams", "Brown", "Jones",
     "Miller", "Davis", "Garcia", "Rodriguez", "Wilson",
     "Taylor", "Thomas", "Moore", "Martin", "Jackson"
-]
+)
 
-ENGLISH_COUNTRIES = [
+ENGLISH_COUNTRIES = (
     "United States",
     "United Kingdom",
     "Canada",
     "Australia",
     "Ireland",
     "New Zealand",
-]
+)
 
 DEFAULT_COUNTRY = "United States"
 
@@ -53,34 +57,132 @@ DEFAULT_COUNTRY = "United States"
 # OS helpers (topmost & clipboard)
 # =============================
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import windll, wintypes  # type: ignore
+
+    _user32 = windll.user32
+    _GetForegroundWindow = _user32.GetForegroundWindow
+    _GetForegroundWindow.argtypes = []
+    _GetForegroundWindow.restype = wintypes.HWND
+    _SetWindowPos = _user32.SetWindowPos
+    _SetWindowPos.argtypes = [
+        wintypes.HWND, wintypes.HWND,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.c_uint,
+    ]
+    _SetWindowPos.restype = wintypes.BOOL
+
+    _kernel32 = windll.kernel32
+    _OpenClipboard = _user32.OpenClipboard
+    _OpenClipboard.argtypes = [wintypes.HWND]
+    _OpenClipboard.restype = wintypes.BOOL
+    _EmptyClipboard = _user32.EmptyClipboard
+    _EmptyClipboard.argtypes = []
+    _EmptyClipboard.restype = wintypes.BOOL
+    _SetClipboardData = _user32.SetClipboardData
+    _SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    _SetClipboardData.restype = wintypes.HANDLE
+    _CloseClipboard = _user32.CloseClipboard
+    _CloseClipboard.argtypes = []
+    _CloseClipboard.restype = wintypes.BOOL
+    _GlobalAlloc = _kernel32.GlobalAlloc
+    _GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    _GlobalAlloc.restype = wintypes.HGLOBAL
+    _GlobalLock = _kernel32.GlobalLock
+    _GlobalLock.argtypes = [wintypes.HGLOBAL]
+    _GlobalLock.restype = wintypes.LPVOID
+    _GlobalUnlock = _kernel32.GlobalUnlock
+    _GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    _GlobalUnlock.restype = wintypes.BOOL
+    _GlobalFree = _kernel32.GlobalFree
+    _GlobalFree.argtypes = [wintypes.HGLOBAL]
+    _GlobalFree.restype = wintypes.HGLOBAL
+
 def set_window_always_on_top_safe() -> None:
     """Make console 'always on top' on Windows without moving/resizing."""
     if sys.platform != "win32":
         return
     try:
-        from ctypes import windll  # type: ignore
         HWND_TOPMOST = -1
         SWP_NOMOVE = 0x0002
         SWP_NOSIZE = 0x0001
         flags = SWP_NOMOVE | SWP_NOSIZE
-        hwnd = windll.user32.GetForegroundWindow()
+        hwnd = _GetForegroundWindow()
         if hwnd:
-            windll.user32.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, flags)
+            _SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, flags)
     except Exception:
         pass
 
+def _win32_set_clipboard(text: str) -> bool:
+    """Put text on the Windows clipboard as CF_UNICODETEXT via user32/kernel32."""
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+    data = text.encode("utf-16-le") + b"\0\0"
+
+    if not _OpenClipboard(None):
+        return False
+    try:
+        _EmptyClipboard()
+        h_mem = _GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not h_mem:
+            return False
+        ptr = _GlobalLock(h_mem)
+        if not ptr:
+            _GlobalFree(h_mem)
+            return False
+        ctypes.memmove(ptr, data, len(data))
+        _GlobalUnlock(h_mem)
+        # On success the clipboard owns the memory; otherwise we must free it.
+        if not _SetClipboardData(CF_UNICODETEXT, h_mem):
+            _GlobalFree(h_mem)
+            return False
+        return True
+    finally:
+        _CloseClipboard()
+
+def _find_clipboard_command() -> list[str] | None:
+    """Pick a native clipboard tool for macOS/Linux, if one is installed."""
+    if sys.platform == "darwin":
+        candidates = [["pbcopy"]]
+    else:
+        candidates = [
+            ["xclip", "-selection", "clipboard"],
+            ["xsel", "--clipboard", "--input"],
+        ]
+        if os.environ.get("WAYLAND_DISPLAY"):
+            candidates.insert(0, ["wl-copy"])
+    for cmd in candidates:
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+_CLIP_CMD = None if sys.platform == "win32" else _find_clipboard_command()
+
 def copy_to_clipboard(text: str) -> bool:
     """
     Copy text to clipboard.
-    - Windows: uses 'clip'
-    - Others: tries tkinter if available
+    - Windows: Win32 clipboard API, falls back to 'clip'
+    - macOS/Linux: pbcopy / wl-copy / xclip / xsel, else tkinter if available
     """
     try:
         if sys.platform == "win32":
+            try:
+                if _win32_set_clipboard(text):
+                    return True
+            except Exception:
+                pass
             p = subprocess.Popen(["clip"], stdin=subprocess.PIPE, text=True)
             p.communicate(text)
             return p.returncode == 0
         else:
+            if _CLIP_CMD is not None:
+                try:
+                    r = subprocess.run(_CLIP_CMD, input=text, text=True, check=False)
+                    if r.returncode == 0:
+                        return True
+                except Exception:
+                    pass
             try:
                 import tkinter as tk  # type: ignore
                 r = tk.Tk()
@@ -99,34 +201,42 @@ def copy_to_clipboard(text: str) -> bool:
 # Validation
 # =============================
 
-EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
-
 def is_valid_email(email: str) -> bool:
-    return bool(EMAIL_REGEX.match(email.strip()))
+    """Structural check: one '@', a '.' inside the domain, no whitespace."""
+    e = email.strip()
+    at = e.find("@")
+    if at <= 0 or at != e.rfind("@"):
+        return False
+    dot = e.find(".", at + 2)
+    if dot == -1 or dot == len(e) - 1:
+        return False
+    return not any(c.isspace() for c in e)
 
 # =============================
 # Dates & names
 # =============================
 
+_MONTH_ABBR = tuple(calendar.month_abbr)
+_DAYS_NON_LEAP = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_LEAP = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 def convert_month_number(month_number: int) -> str:
-    return calendar.month_abbr[month_number]
+    return _MONTH_ABBR[month_number]
 
 def generate_valid_date(min_year: int = DOB_YEAR_MIN, max_year: int = DOB_YEAR_MAX) -> str:
     """Return a valid date string (DD/Mon/YYYY) within the given range."""
-    year = secrets.choice(range(min_year, max_year + 1))
-    month = secrets.choice(range(1, 13))
-    while True:
-        day = secrets.choice(range(1, 32))
-        try:
-            d = date(year, month, day)
-            return f"{d.day:02d}/{convert_month_number(d.month)}/{d.year}"
-        except ValueError:
-            continue
+    year = secrets.randbelow(max_year - min_year + 1) + min_year
+    month = secrets.randbelow(12) + 1
+    days = _DAYS_LEAP if calendar.isleap(year) else _DAYS_NON_LEAP
+    day = secrets.randbelow(days[month]) + 1
+    return f"{day:02d}/{_MONTH_ABBR[month]}/{year}"
 
 def generate_names() -> tuple[str, str]:
     """English first/last name."""
     return secrets.choice(FIRST_NAMES), secrets.choice(LAST_NAMES)
 
+_DISPLAY_NAME_DISALLOWED = re.compile(r"[^a-z0-9_]")
+
 def sanitize_display_name(base: str) -> str:
     """
     Conservative display name rules:
@@ -134,14 +244,12 @@ def sanitize_display_name(base: str) -> str:
     - starts with a letter
     - a–z, 0–9, underscore only
     """
-    allowed = string.ascii_lowercase + string.digits + "_"
     base = base.lower()
 
     if not base or not base[0].isalpha():
         base = "a" + base
 
-    filtered = [ch if ch in allowed else "_" for ch in base]
-    s = "".join(filtered)
+    s = _DISPLAY_NAME_DISALLOWED.sub("_", base)
 
     s = s[:16]
     while len(s) < 3:
@@ -157,6 +265,12 @@ def generate_display_name(first: str, last: str) -> str:
 # Passwords
 # =============================
 
+_PW_ALPHABET_BYTES = PASSWORD_ALPHABET.encode("ascii")
+_PW_ALPHABET_LEN = len(_PW_ALPHABET_BYTES)
+# Largest multiple of the alphabet size below 256; bytes above it are rejected.
+_PW_BYTE_LIMIT = 256 - (256 % _PW_ALPHABET_LEN)
+_sysrand = secrets.SystemRandom()
+
 def generate_password(length: int = PASSWORD_LENGTH) -> str:
     """
     Strong password with:
@@ -172,16 +286,29 @@ def generate_password(length: int = PASSWORD_LENGTH) -> str:
         secrets.choice(string.digits),
         secrets.choice(SAFE_PUNCT),
     ]
-    remaining = [secrets.choice(PASSWORD_ALPHABET) for _ in range(length - len(req))]
-    chars = req + remaining
-    secrets.SystemRandom().shuffle(chars)
-    return "".join(chars)
+    chars = bytearray("".join(req), "ascii")
+
+    # One urandom read per pass, rejection-sampled to avoid modulo bias.
+    alphabet = _PW_ALPHABET_BYTES
+    k = _PW_ALPHABET_LEN
+    limit = _PW_BYTE_LIMIT
+    while len(chars) < length:
+        for b in os.urandom((length - len(chars)) * 2):
+            if b < limit:
+                chars.append(alphabet[b % k])
+                if len(chars) == length:
+                    break
+
+    _sysrand.shuffle(chars)
+    return chars.decode("ascii")
 
 # =============================
 # Dataclass & I/O
 # =============================
 
-@dataclass
+_SEP = "-" * 31
+
+@dataclass(slots=True)
 class AccountDetails:
     email: str
     first_name: str
@@ -193,23 +320,35 @@ class AccountDetails:
     created_at: str
 
     def to_text_block(self) -> str:
-        lines = [
-            f"Email: {self.email}",
-            f"First name: {self.first_name}",
-            f"Last name: {self.last_name}",
-            f"Create password: {self.password}",
-            f"Add a display name: {self.display_name}",
-            f"Date: {self.date_str}",
-            f"Country: {self.country}",
-            f"Created: {self.created_at}",
-            "-" * 31,
-        ]
-        return "\n".join(lines)
+        return (
+            f"Email: {self.email}\n"
+            f"First name: {self.first_name}\n"
+            f"Last name: {self.last_name}\n"
+            f"Create password: {self.password}\n"
+            f"Add a display name: {self.display_name}\n"
+            f"Date: {self.date_str}\n"
+            f"Country: {self.country}\n"
+            f"Created: {self.created_at}\n"
+            f"{_SEP}"
+        )
+
+_open_outputs: dict[Path, TextIO] = {}
+
+def _close_outputs() -> None:
+    for f in _open_outputs.values():
+        f.close()
+    _open_outputs.clear()
+
+atexit.register(_close_outputs)
 
 def append_to_file(block: str, file_path: Path = OUTPUT_FILE) -> None:
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("a", encoding="utf-8") as f:
-        f.write(block + "\n")
+    """Append a block, keeping the file open (line-buffered) for the session."""
+    f = _open_outputs.get(file_path)
+    if f is None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        f = file_path.open("a", encoding="utf-8", buffering=1)
+        _open_outputs[file_path] = f
+    f.write(block + "\n")
 
 # =============================
 # Generation